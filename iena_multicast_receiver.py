@@ -32,16 +32,34 @@ Examples:
   # Skip scan — connect directly to a known key
   python iena_multicast_receiver.py --key 0x0A01
 
+At sustained multi-kHz packet rates the default Linux socket receive buffer
+drops packets. The receiver requests a 16 MiB SO_RCVBUF, but the kernel caps
+it at net.core.rmem_max; raise the cap with:
+  sudo sysctl -w net.core.rmem_max=16777216
+
+On machines with two or more CPUs the receiver thread is pinned to its own
+core (the plot stays on the others) and asks for a higher scheduling
+priority (nice -5 on Linux, which needs root or CAP_SYS_NICE; thread
+priority "above normal" on Windows, where pinning uses SetThreadAffinityMask).
+Other platforms keep the default priority. Both steps are best-effort and
+skipped where not permitted.
+
 Dependencies:
   pip install matplotlib numpy
 """
 
 import argparse
-import collections
+import ctypes
+import errno
+import operator
+import os
+import selectors
 import socket
 import struct
+import sys
 import threading
 import time
+from array import array
 from xml.etree import ElementTree
 
 import matplotlib.pyplot as plt
@@ -53,27 +71,52 @@ IENA_TRAILER = 0xDEAD
 HEADER_SIZE = 16
 TRAILER_SIZE = 2
 
+RECV_SOCKBUF = 16 * 1024 * 1024   # requested SO_RCVBUF size in bytes
 
-def load_xidml(config_path: str) -> list[str]:
-    """Parse a XidML file and return parameter names ordered by index."""
-    tree = ElementTree.parse(config_path)
-    root = tree.getroot()
+# Precompiled packet layouts (big-endian) — avoids re-parsing the format
+# string on every packet.
+_HEADER = struct.Struct('>HH I HH HH')
+# The 2-byte trailer is compared byte-wise; cheaper than a Struct call.
+_TRAILER_HI, _TRAILER_LO = IENA_TRAILER >> 8, IENA_TRAILER & 0xFF
+# Payload floats are decoded straight from the packet buffer by numpy.
+_PAYLOAD_DTYPE = np.dtype('>f4')
 
-    params = []
-    for param in root.iter('Parameter'):
-        name = param.get('name')
-        index = int(param.get('index', str(len(params))))
-        params.append((index, name))
 
-    params.sort(key=lambda p: p[0])
-    return [name for _, name in params]
+def load_xidml(config_path: str
+               ) -> tuple[list[str], dict[str, tuple[float, float]]]:
+    """
+    Parse a XidML file and return (names, ranges): parameter names ordered by
+    index, and {name: (RangeMinimum, RangeMaximum)} for every parameter that
+    declares both as numbers.
+    """
+    params = []
+    ranges = {}
+    # stream the file; each Parameter is freed as soon as it has been read
+    for _, el in ElementTree.iterparse(config_path, events=('end',)):
+        if el.tag == 'Parameter':
+            name = el.get('name')
+            index = int(el.get('index', str(len(params))))
+            params.append((index, name))
+
+            lo = el.findtext('RangeMinimum')
+            hi = el.findtext('RangeMaximum')
+            if lo is not None and hi is not None:
+                try:
+                    ranges[name] = (float(lo), float(hi))
+                except ValueError:
+                    pass   # range is optional; just don't fix the y-limits
+            el.clear()
+
+    params.sort(key=operator.itemgetter(0))
+    return [name for _, name in params], ranges
 
 
 # ---------------------------------------------------------------------------
 # Packet parsing
 # ---------------------------------------------------------------------------
 
-def parse_iena_packet(data: bytes, num_params: int) -> dict | None:
+def parse_iena_packet(data: bytes | memoryview,
+                      num_params: int) -> dict | None:
     """Parse a raw IENA packet. Returns dict or None if malformed."""
     payload_size = num_params * 4
     expected_size = HEADER_SIZE + payload_size + TRAILER_SIZE
@@ -81,14 +124,16 @@ def parse_iena_packet(data: bytes, num_params: int) -> dict | None:
     if len(data) < expected_size:
         return None
 
-    key, size_words, time_high, time_low, status, seq, n2 = struct.unpack_from(
-        '>HH I HH HH', data, 0)
+    key, size_words, time_high, time_low, status, seq, n2 = _HEADER.unpack_from(
+        data, 0)
 
-    trailer, = struct.unpack_from('>H', data, HEADER_SIZE + payload_size)
-    if trailer != IENA_TRAILER:
+    off = HEADER_SIZE + payload_size
+    if data[off] != _TRAILER_HI or data[off + 1] != _TRAILER_LO:
         return None
 
-    values = list(struct.unpack_from(f'>{num_params}f', data, HEADER_SIZE))
+    # native float32 copy, so the result doesn't alias a reused receive buffer
+    values = np.frombuffer(data, dtype=_PAYLOAD_DTYPE, count=num_params,
+                           offset=HEADER_SIZE).astype(np.float32)
 
     return {
         'key': key,
@@ -101,6 +146,37 @@ def parse_iena_packet(data: bytes, num_params: int) -> dict | None:
     }
 
 
+def parse_iena_packet_into(data: bytes | memoryview, out: np.ndarray,
+                           trailer_off: int | None = None
+                           ) -> tuple[int, int, int] | None:
+    """
+    Decode a raw IENA packet's payload into the preallocated float32 array
+    `out` (one slot per parameter). Returns (key, sequence, time_us) or None
+    if malformed. Unlike parse_iena_packet no dict or array is allocated.
+    `trailer_off` may be passed precomputed when the stream layout is fixed.
+    """
+    num_params = len(out)
+    off = HEADER_SIZE + num_params * 4 if trailer_off is None else trailer_off
+    if (len(data) < off + TRAILER_SIZE
+            or data[off] != _TRAILER_HI or data[off + 1] != _TRAILER_LO):
+        return None
+
+    key, _, time_high, _, _, seq, _ = _HEADER.unpack_from(data, 0)
+
+    # byteswap + copy in one C loop
+    out[:] = np.frombuffer(data, dtype=_PAYLOAD_DTYPE, count=num_params,
+                           offset=HEADER_SIZE)
+    return key, seq, time_high
+
+
+def iena_packet_dtype(num_params: int) -> np.dtype:
+    """numpy structured dtype matching one IENA packet with `num_params` floats."""
+    return np.dtype([('key', '>u2'), ('size', '>u2'), ('time_hi', '>u4'),
+                     ('time_lo', '>u2'), ('status', '>u2'), ('seq', '>u2'),
+                     ('n2', '>u2'), ('vals', _PAYLOAD_DTYPE, (num_params,)),
+                     ('trailer', '>u2')])
+
+
 # ---------------------------------------------------------------------------
 # Multicast socket helper
 # ---------------------------------------------------------------------------
@@ -111,6 +187,30 @@ def create_multicast_socket(groups: list[str], port: int,
     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
     sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
 
+    # enlarge the kernel receive queue so bursts at high packet rates are not
+    # dropped. Linux silently caps the request at net.core.rmem_max; macOS/BSD
+    # reject sizes above kern.ipc.maxsockbuf with ENOBUFS, so halve and retry.
+    requested = RECV_SOCKBUF
+    while True:
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, requested)
+            break
+        except OSError:
+            requested //= 2
+            if requested < 64 * 1024:
+                break   # keep the OS default
+    granted = sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+    linux = sys.platform.startswith('linux')
+    if linux:
+        # Linux reports twice the granted size (the extra half is kernel
+        # bookkeeping overhead), see socket(7)
+        granted //= 2
+    print(f"Socket receive buffer: {granted // 1024} KiB")
+    if granted < RECV_SOCKBUF:
+        hint = (f" — raise the cap with "
+                f"'sysctl -w net.core.rmem_max={RECV_SOCKBUF}'" if linux else "")
+        print(f"  (requested {RECV_SOCKBUF // 1024} KiB{hint})")
+
     # bind to all interfaces on the given port
     sock.bind(('', port))
 
@@ -123,6 +223,138 @@ def create_multicast_socket(groups: list[str], port: int,
     return sock
 
 
+# ---------------------------------------------------------------------------
+# Batched receive
+# ---------------------------------------------------------------------------
+
+RECV_BATCH = 32        # max datagrams per receive call
+RECV_BUFSIZE = 4096    # bytes per datagram buffer
+POLL_INTERVAL = 0.2    # seconds between checks of the stop/deadline flags
+
+
+class _IoVec(ctypes.Structure):
+    _fields_ = [('iov_base', ctypes.c_void_p),
+                ('iov_len', ctypes.c_size_t)]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [('msg_name', ctypes.c_void_p),
+                ('msg_namelen', ctypes.c_uint32),
+                ('msg_iov', ctypes.POINTER(_IoVec)),
+                ('msg_iovlen', ctypes.c_size_t),
+                ('msg_control', ctypes.c_void_p),
+                ('msg_controllen', ctypes.c_size_t),
+                ('msg_flags', ctypes.c_int)]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [('msg_hdr', _MsgHdr),
+                ('msg_len', ctypes.c_uint)]
+
+
+_SOCKADDR_SIZE = 128   # sizeof(struct sockaddr_storage)
+
+
+def _load_recvmmsg():
+    """Return libc's recvmmsg(2) via ctypes, or None where unavailable."""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        fn = ctypes.CDLL(None, use_errno=True).recvmmsg
+    except (OSError, AttributeError):
+        return None
+    fn.argtypes = [ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint,
+                   ctypes.c_int, ctypes.c_void_p]
+    fn.restype = ctypes.c_int
+    return fn
+
+
+_recvmmsg = _load_recvmmsg()
+
+
+class RecvBatch:
+    """
+    Preallocated buffer for receiving up to `size` datagrams per call.
+
+    All datagram slots live in one contiguous bytearray that is reused for
+    every call, so the receive path allocates nothing per packet.
+
+    Expects a non-blocking socket. On Linux the whole batch is fetched with
+    a single recvmmsg(2) syscall; elsewhere it falls back to a loop of
+    recvfrom_into() that stops as soon as the socket has nothing more queued.
+    """
+
+    def __init__(self, size: int = RECV_BATCH, bufsize: int = RECV_BUFSIZE):
+        self.size = size
+        self._rxbuf = bytearray(size * bufsize)
+        self._rxmv = memoryview(self._rxbuf)
+        self.views = [self._rxmv[i * bufsize:(i + 1) * bufsize]
+                      for i in range(size)]
+        self.lengths = [0] * size
+        self._addrs: list = [None] * size
+
+        if _recvmmsg is not None:
+            base = ctypes.addressof(
+                (ctypes.c_char * len(self._rxbuf)).from_buffer(self._rxbuf))
+            self._names = [ctypes.create_string_buffer(_SOCKADDR_SIZE)
+                           for _ in range(size)]
+            self._iovecs = (_IoVec * size)()
+            self._msgs = (_MMsgHdr * size)()
+            for i in range(size):
+                self._iovecs[i].iov_base = base + i * bufsize
+                self._iovecs[i].iov_len = bufsize
+                hdr = self._msgs[i].msg_hdr
+                hdr.msg_name = ctypes.addressof(self._names[i])
+                hdr.msg_iov = ctypes.pointer(self._iovecs[i])
+                hdr.msg_iovlen = 1
+
+    def recv(self, sock: socket.socket) -> int:
+        """
+        Receive as many queued datagrams as fit in the batch without
+        blocking. Returns the number received (0 if none were queued).
+        """
+        if _recvmmsg is not None:
+            return self._recv_mmsg(sock)
+        return self._recv_loop(sock)
+
+    def _recv_mmsg(self, sock: socket.socket) -> int:
+        for m in self._msgs:
+            m.msg_hdr.msg_namelen = _SOCKADDR_SIZE
+        n = _recvmmsg(sock.fileno(), self._msgs, self.size,
+                      socket.MSG_DONTWAIT, None)
+        if n < 0:
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+                return 0
+            raise OSError(err, os.strerror(err))
+        for i in range(n):
+            self.lengths[i] = self._msgs[i].msg_len
+            self._addrs[i] = None
+        return n
+
+    def _recv_loop(self, sock: socket.socket) -> int:
+        n = 0
+        while n < self.size:
+            try:
+                self.lengths[n], self._addrs[n] = sock.recvfrom_into(self.views[n])
+            except BlockingIOError:
+                break
+            n += 1
+        return n
+
+    def packet(self, i: int) -> memoryview:
+        """Zero-copy view of the i-th received datagram."""
+        return self.views[i][:self.lengths[i]]
+
+    def source_addr(self, i: int) -> bytes:
+        """Packed 4-byte source IPv4 address of the i-th received datagram."""
+        addr = self._addrs[i]
+        if addr is None:
+            # struct sockaddr_in: family(2) + port(2) + addr(4)
+            return ctypes.string_at(ctypes.addressof(self._names[i]) + 4, 4)
+        return socket.inet_aton(addr[0])
+
+
 # ---------------------------------------------------------------------------
 # Stream discovery
 # ---------------------------------------------------------------------------
@@ -131,37 +363,68 @@ def discover_streams(groups: list[str], port: int, duration: float,
                      iface: str = '', num_params: int = 26) -> dict:
     """
     Listen for `duration` seconds and return a dict of discovered streams:
-      { (key, source_ip, group): { 'count': int, 'first': float, 'last': float } }
+      { key: { 'count': int, 'first': float, 'last': float,
+               'sources': set[str] } }
+
+    Packets are only copied during the scan; they are parsed all at once
+    afterwards through a numpy structured dtype.
     """
     sock = create_multicast_socket(groups, port, iface)
-    sock.settimeout(0.5)
-
-    streams: dict[tuple, dict] = {}
+    sock.setblocking(False)
+    sel = selectors.DefaultSelector()
+    sel.register(sock, selectors.EVENT_READ)
+
+    pkt_size = HEADER_SIZE + num_params * 4 + TRAILER_SIZE
+    raw = bytearray()          # packets back to back, truncated to pkt_size
+    src_addrs = bytearray()    # packed source IPv4 address per packet
+    arrivals = array('d')      # arrival time per packet
     deadline = time.monotonic() + duration
 
     print(f"Scanning for IENA streams on {', '.join(groups)}:{port} "
           f"for {duration:.0f}s ...")
 
+    batch = RecvBatch()
     while time.monotonic() < deadline:
-        try:
-            data, (src_ip, src_port) = sock.recvfrom(4096)
-        except socket.timeout:
-            continue
-
-        pkt = parse_iena_packet(data, num_params)
-        if pkt is None:
-            continue
-
-        # we don't know which group the packet came from at the socket
-        # level, so we just record the source IP
-        ident = (pkt['key'], src_ip)
-        now = time.monotonic()
-        if ident not in streams:
-            streams[ident] = {'count': 0, 'first': now, 'last': now}
-        streams[ident]['count'] += 1
-        streams[ident]['last'] = now
-
+        for sel_key, _ in sel.select(POLL_INTERVAL):
+            # drain everything queued on the ready socket, batch by batch
+            while n := batch.recv(sel_key.fileobj):
+                now = time.monotonic()
+                for i in range(n):
+                    pkt = batch.packet(i)
+                    if len(pkt) < pkt_size:
+                        continue
+                    raw += pkt[:pkt_size]
+                    # we don't know which group the packet came from at the
+                    # socket level, so we just record the source IP
+                    src_addrs += batch.source_addr(i)
+                    arrivals.append(now)
+                # stop at a short batch (queue empty) or the deadline, so a
+                # flood faster than we can drain can't stretch the scan
+                if n < batch.size or now >= deadline:
+                    break
+
+    sel.close()
     sock.close()
+
+    packets = np.frombuffer(raw, dtype=iena_packet_dtype(num_params))
+    valid = packets['trailer'] == IENA_TRAILER
+    keys = packets['key'][valid]
+    times = np.frombuffer(arrivals, dtype=np.float64)[valid]
+    srcs = np.frombuffer(src_addrs, dtype='>u4')[valid]
+
+    uniq, inverse, counts = np.unique(keys, return_inverse=True,
+                                      return_counts=True)
+    firsts = np.full(len(uniq), np.inf)
+    lasts = np.full(len(uniq), -np.inf)
+    np.minimum.at(firsts, inverse, times)
+    np.maximum.at(lasts, inverse, times)
+
+    streams = {int(key): {'count': int(count), 'first': float(first),
+                          'last': float(last), 'sources': set()}
+               for key, count, first, last in zip(uniq, counts, firsts, lasts)}
+    for pair in np.unique((keys.astype(np.uint64) << 32) | srcs):
+        src_ip = socket.inet_ntoa(int(pair & 0xFFFFFFFF).to_bytes(4, 'big'))
+        streams[int(pair >> 32)]['sources'].add(src_ip)
     return streams
 
 
@@ -172,15 +435,16 @@ def choose_stream(streams: dict) -> int | None:
         return None
 
     entries = []
-    for (key, src_ip), info in sorted(streams.items()):
+    for key, info in sorted(streams.items()):
         elapsed = max(info['last'] - info['first'], 0.001)
         rate = info['count'] / elapsed
-        entries.append((key, src_ip, info['count'], rate))
+        src_ips = ', '.join(sorted(info['sources']))
+        entries.append((key, src_ips, info['count'], rate))
 
     print(f"\n{'#':>3}  {'Key':>8}  {'Source IP':<17}  {'Packets':>8}  {'Rate':>8}")
     print('-' * 55)
-    for idx, (key, src_ip, count, rate) in enumerate(entries, 1):
-        print(f"{idx:>3}  0x{key:04X}    {src_ip:<17}  {count:>8}  {rate:>7.1f}/s")
+    for idx, (key, src_ips, count, rate) in enumerate(entries, 1):
+        print(f"{idx:>3}  0x{key:04X}    {src_ips:<17}  {count:>8}  {rate:>7.1f}/s")
 
     print()
     while True:
@@ -199,12 +463,72 @@ def choose_stream(streams: dict) -> int | None:
         print(f"Please enter a number between 1 and {len(entries)}.")
 
 
+# ---------------------------------------------------------------------------
+# Thread placement (best-effort)
+# ---------------------------------------------------------------------------
+
+INGEST_NICE = -5                    # niceness requested for the receiver thread
+_THREAD_PRIORITY_ABOVE_NORMAL = 1   # Windows SetThreadPriority level
+
+
+def _available_cpus() -> set[int]:
+    if hasattr(os, 'sched_getaffinity'):
+        return os.sched_getaffinity(0)
+    return set(range(os.cpu_count() or 1))
+
+
+def _pin_current_thread(cpus: set[int]) -> bool:
+    """Restrict the calling thread to `cpus`. Returns True on success."""
+    if hasattr(os, 'sched_setaffinity'):
+        # Linux: pid 0 applies to the calling thread only
+        try:
+            os.sched_setaffinity(0, cpus)
+            return True
+        except OSError:
+            return False
+    if sys.platform == 'win32':
+        kernel32 = ctypes.windll.kernel32
+        kernel32.GetCurrentThread.restype = ctypes.c_void_p
+        kernel32.SetThreadAffinityMask.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+        kernel32.SetThreadAffinityMask.restype = ctypes.c_size_t
+        mask = sum(1 << cpu for cpu in cpus)
+        return bool(kernel32.SetThreadAffinityMask(kernel32.GetCurrentThread(), mask))
+    return False
+
+
+def _raise_thread_priority() -> bool:
+    """Raise the calling thread's scheduling priority. Returns True on success."""
+    if sys.platform == 'win32':
+        kernel32 = ctypes.windll.kernel32
+        kernel32.GetCurrentThread.restype = ctypes.c_void_p
+        kernel32.SetThreadPriority.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        return bool(kernel32.SetThreadPriority(kernel32.GetCurrentThread(),
+                                               _THREAD_PRIORITY_ABOVE_NORMAL))
+    if not sys.platform.startswith('linux'):
+        # elsewhere os.nice() renices the whole process, plot thread included
+        return False
+    # on Linux nice values are per thread, so this leaves the plot thread alone
+    try:
+        os.nice(INGEST_NICE)
+        return True
+    except OSError:
+        return False
+
+
 # ---------------------------------------------------------------------------
 # Filtered receiver (only keeps packets matching the chosen key)
 # ---------------------------------------------------------------------------
 
 class IenaMulticastReceiver:
-    """Threaded multicast receiver that accumulates data for one IENA key."""
+    """
+    Threaded multicast receiver that accumulates data for one IENA key.
+
+    Samples go into a single-producer/single-consumer ring buffer without a
+    lock. `packet_count` is the only shared index: the receiver thread fills
+    ring rows first and then publishes them by storing the new count, and
+    get_data() snapshots the count once before copying. This relies on
+    CPython's GIL making a plain int attribute store/load atomic.
+    """
 
     def __init__(self, groups: list[str], port: int, key_filter: int,
                  window: float, param_names: list[str], iface: str = ''):
@@ -215,63 +539,127 @@ class IenaMulticastReceiver:
         self.param_names = param_names
         self.num_params = len(param_names)
         self.iface = iface
-        self.lock = threading.Lock()
 
-        maxlen = 10_000
-        self.timestamps = collections.deque(maxlen=maxlen)
-        self.series = {n: collections.deque(maxlen=maxlen) for n in self.param_names}
+        # preallocated ring buffer (struct-of-arrays): one row of values per
+        # received packet, one column per parameter. Packet n lives in row
+        # n % maxlen; packet_count is the number of published rows.
+        self._maxlen = maxlen = 10_000
+        self._values = np.empty((maxlen, self.num_params), dtype=np.float32)
+        self._ts = np.empty(maxlen, dtype=np.float64)
+        self._name_to_col = {n: i for i, n in enumerate(self.param_names)}
+        # fixed packet layout for this stream
+        self._trailer_off = HEADER_SIZE + self.num_params * 4
+        # receive buffers, reused for every batch
+        self._rx = RecvBatch()
 
         self.packet_count = 0
         self._running = True
+        self._ingest_cpu: int | None = None   # chosen in start()
 
     def start(self):
+        # Give the receiver thread a core of its own: keep the calling (plot)
+        # thread off that core before spawning, so the two don't share caches
+        # or compete for one CPU. The new thread pins itself in _listen.
+        cpus = _available_cpus()
+        self._ingest_cpu = max(cpus) if len(cpus) > 1 else None
+        if self._ingest_cpu is not None:
+            _pin_current_thread(cpus - {self._ingest_cpu})
+
         t = threading.Thread(target=self._listen, daemon=True)
         t.start()
 
     def _listen(self):
+        if self._ingest_cpu is not None and _pin_current_thread({self._ingest_cpu}):
+            print(f"Receiver thread pinned to CPU {self._ingest_cpu}")
+        if not _raise_thread_priority():
+            print("Receiver thread priority unchanged (not permitted or not supported)")
+
         sock = create_multicast_socket(self.groups, self.port, self.iface)
-        sock.settimeout(1.0)
+        sock.setblocking(False)
+        sel = selectors.DefaultSelector()
+        sel.register(sock, selectors.EVENT_READ)
         print(f"Receiving stream key=0x{self.key_filter:04X} on "
               f"{', '.join(self.groups)}:{self.port} ...")
 
+        # short poll so stop() takes effect promptly; one selector can later
+        # watch a socket per group
         while self._running:
-            try:
-                data, addr = sock.recvfrom(4096)
-            except socket.timeout:
-                continue
+            for sel_key, _ in sel.select(POLL_INTERVAL):
+                self._drain(sel_key.fileobj)
 
-            pkt = parse_iena_packet(data, self.num_params)
-            if pkt is None or pkt['key'] != self.key_filter:
-                continue
+        sel.close()
+        sock.close()
 
+    def _drain(self, sock: socket.socket):
+        """Receive and store every datagram queued on `sock`, batch by batch."""
+        key_hi, key_lo = self.key_filter >> 8, self.key_filter & 0xFF
+        batch = self._rx
+        while n := batch.recv(sock):
+            # decode straight into the ring rows past the published count;
+            # get_data never reads those rows
             now = time.time()
-            with self.lock:
-                self.timestamps.append(now)
-                for i, name in enumerate(self.param_names):
-                    self.series[name].append(pkt['values'][i])
-                self.packet_count += 1
-
-        sock.close()
+            values, ts = self._values, self._ts
+            written = self.packet_count
+            head = written % self._maxlen
+            k = 0
+            for i in range(n):
+                pkt = batch.packet(i)
+                # cheap 2-byte key check before decoding anything else
+                if len(pkt) < 2 or pkt[0] != key_hi or pkt[1] != key_lo:
+                    continue
+                if parse_iena_packet_into(pkt, values[head],
+                                          self._trailer_off) is None:
+                    continue
+                ts[head] = now
+                head = (head + 1) % self._maxlen
+                k += 1
+
+            if k:
+                self.packet_count = written + k   # publish
+            # stop at a short batch (queue empty) or on stop(), so a flood
+            # faster than we can drain can't keep the thread from exiting
+            if n < batch.size or not self._running:
+                break
 
     def get_data(self, var_names: list[str]):
         """Return (relative_times, {name: values}) trimmed to the window."""
-        with self.lock:
-            if not self.timestamps:
-                empty = np.array([])
+        empty = np.array([])
+        maxlen = self._maxlen
+        written = self.packet_count   # snapshot the published count once
+
+        # The receiver thread may be decoding up to RECV_BATCH rows past the
+        # published count, which overlap the oldest rows once the ring has
+        # wrapped; leave those out.
+        first = max(0, written + RECV_BATCH - maxlen)
+        if written <= first:
+            return empty, {n: empty for n in var_names}
+
+        cols = [self._name_to_col[n] for n in var_names]
+        lo, hi = first % maxlen, written % maxlen
+        if lo < hi:
+            ts = self._ts[lo:hi].copy()
+            values = self._values[lo:hi, cols]
+        else:
+            # wrapped: unroll oldest -> newest
+            ts = np.concatenate((self._ts[lo:], self._ts[:hi]))
+            values = np.concatenate((self._values[lo:, cols],
+                                     self._values[:hi, cols]))
+
+        # drop any oldest rows the receiver thread overwrote while we copied
+        stale = self.packet_count + RECV_BATCH - maxlen - first
+        if stale > 0:
+            ts = ts[stale:]
+            values = values[stale:]
+            if not len(ts):
                 return empty, {n: empty for n in var_names}
 
-            ts = np.array(self.timestamps)
-            now = ts[-1]
-            cutoff = now - self.window
-            mask = ts >= cutoff
-            rel = ts[mask] - now
-
-            result = {}
-            for name in var_names:
-                arr = np.array(self.series[name])
-                result[name] = arr[mask]
+        now = ts[-1]
+        cutoff = now - self.window
+        mask = ts >= cutoff
+        rel = ts[mask] - now
+        values = values[mask]
 
-            return rel, result
+        return rel, {n: values[:, i] for i, n in enumerate(var_names)}
 
     def stop(self):
         self._running = False
@@ -281,17 +669,51 @@ class IenaMulticastReceiver:
 # Live plot
 # ---------------------------------------------------------------------------
 
+PLOT_BINS = 500   # max min/max bins drawn per line
+
+
+def mm_downsample(x: np.ndarray, y: np.ndarray,
+                  nbins: int = PLOT_BINS) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce (x, y) to at most 2 * nbins points by splitting x into equal-width
+    bins and keeping each bin's minimum and maximum, so spikes stay visible.
+    `x` must be sorted ascending.
+    """
+    edges = np.linspace(x[0], x[-1], nbins + 1)[:-1]
+    starts = np.unique(np.searchsorted(x, edges))   # drops empty bins
+    ymin = np.minimum.reduceat(y, starts)
+    ymax = np.maximum.reduceat(y, starts)
+
+    xs = np.repeat(x[starts], 2)
+    ys = np.empty(len(xs), dtype=y.dtype)
+    ys[0::2] = ymin
+    ys[1::2] = ymax
+    return xs, ys
+
+
+def _padded_ylim(lo: float, hi: float) -> tuple[float, float]:
+    margin = max((hi - lo) * 0.1, 0.5)
+    return lo - margin, hi + margin
+
+
 def run_live_plot(receiver: IenaMulticastReceiver, selected: list[str],
-                  window: float):
-    """Matplotlib live plot for the selected variables."""
+                  window: float,
+                  ranges: dict[str, tuple[float, float]] | None = None):
+    """
+    Matplotlib live plot for the selected variables.
+
+    Lines are blitted at 10 Hz; the axes are only redrawn when the y-limits
+    change. If `ranges` (from XidML) covers every selected variable the
+    y-limits are fixed, otherwise they are rescaled once per second.
+    """
     fig, ax = plt.subplots(figsize=(12, 6))
     fig.canvas.manager.set_window_title('IENA Multicast — Live Data')
-    lines = {}
+    pairs = []
     colors = plt.cm.tab10.colors
     for i, name in enumerate(selected):
         line, = ax.plot([], [], label=name,
                         color=colors[i % len(colors)], linewidth=1.5)
-        lines[name] = line
+        pairs.append((name, line))
 
     ax.set_xlabel('Time (s)')
     ax.set_ylabel('Value')
@@ -300,32 +722,44 @@ def run_live_plot(receiver: IenaMulticastReceiver, selected: list[str],
     ax.grid(True, alpha=0.3)
     ax.set_xlim(-window, 0)
 
-    def update(frame):
-        rel_t, data = receiver.get_data(selected)
-        for name in selected:
-            if len(rel_t) > 0:
-                lines[name].set_data(rel_t, data[name])
-        ax.set_xlim(-window, 0)
-
-        if any(len(data[n]) > 0 for n in selected):
-            all_vals = np.concatenate(
-                [data[n] for n in selected if len(data[n]) > 0])
-            if len(all_vals) > 0:
-                lo, hi = np.min(all_vals), np.max(all_vals)
-                margin = max((hi - lo) * 0.1, 0.5)
-                ax.set_ylim(lo - margin, hi + margin)
-
-        status_text.set_text(f'Packets: {receiver.packet_count}')
-        return list(lines.values()) + [status_text]
+    fixed_ylim = bool(ranges) and all(n in ranges for n in selected)
+    if fixed_ylim:
+        ax.set_ylim(*_padded_ylim(min(ranges[n][0] for n in selected),
+                                  max(ranges[n][1] for n in selected)))
 
     status_text = ax.text(0.98, 0.98, '', transform=ax.transAxes,
                           ha='right', va='top', fontsize=9,
                           fontfamily='monospace',
                           bbox=dict(boxstyle='round,pad=0.3',
                                     facecolor='wheat', alpha=0.8))
+    artists = [line for _, line in pairs] + [status_text]
+
+    def update(frame):
+        rel_t, data = receiver.get_data(selected)
+        if len(rel_t) > 0:
+            downsample = len(rel_t) > 2 * PLOT_BINS
+            for name, line in pairs:
+                if downsample:
+                    line.set_data(*mm_downsample(rel_t, data[name]))
+                else:
+                    line.set_data(rel_t, data[name])
+
+            if not fixed_ylim and frame % 10 == 0:
+                lo, hi = np.inf, -np.inf
+                for values in data.values():
+                    lo = min(lo, values.min())
+                    hi = max(hi, values.max())
+                ylim = _padded_ylim(lo, hi)
+                if ylim != ax.get_ylim():
+                    ax.set_ylim(*ylim)
+                    # full redraw so the blit background picks up new ticks
+                    fig.canvas.draw()
+
+        status_text.set_text(f'Packets: {receiver.packet_count}')
+        return artists
 
     ani = animation.FuncAnimation(  # noqa: F841
-        fig, update, interval=100, blit=False, cache_frame_data=False)
+        fig, update, interval=100, blit=True, cache_frame_data=False)
 
     try:
         plt.tight_layout()
@@ -360,10 +794,11 @@ def main():
                         help='Path to XidML config file for parameter names/count')
     args = parser.parse_args()
 
-    # Determine parameter names from XidML or fall back to a-z
+    # Determine parameter names (and plot ranges) from XidML or fall back to a-z
+    ranges = {}
     if args.config:
         try:
-            param_names = load_xidml(args.config)
+            param_names, ranges = load_xidml(args.config)
             print(f"Loaded {len(param_names)} parameters from {args.config}: "
                   f"{', '.join(param_names)}")
         except Exception as e:
@@ -405,7 +840,7 @@ def main():
     receiver.start()
 
     try:
-        run_live_plot(receiver, selected, args.window)
+        run_live_plot(receiver, selected, args.window, ranges)
     finally:
         receiver.stop()
         print(f"\nReceived {receiver.packet_count} packets total.")
@@ -47,94 +47,135 @@ Dependencies:
 """
 
 import argparse
+import ipaddress
+import operator
 import random
 import socket
 import struct
+import sys
 import time
-from datetime import datetime
-from xml.dom.minidom import getDOMImplementation
+from array import array
+from collections.abc import Sequence
+from xml.sax.saxutils import escape
 
 
 IENA_TRAILER = 0xDEAD
+HEADER_SIZE = 16
+TRAILER_SIZE = 2
 
+# Precompiled packet layouts (big-endian) — avoids re-parsing the format
+# string on every packet.
+_HEADER = struct.Struct('>HH I HH HH')
+# The 2-byte trailer is written byte-wise; cheaper than a Struct call.
+_TRAILER_HI, _TRAILER_LO = IENA_TRAILER >> 8, IENA_TRAILER & 0xFF
+# Payload floats are byteswapped in bulk when the host is little-endian.
+_SWAP_PAYLOAD = sys.byteorder == 'little'
 
-def generate_xidml(var_names: list[str], iena_key: int, output_path: str):
-    """Generate a XidML metadata file describing the stream parameters."""
-    impl = getDOMImplementation()
-    doc = impl.createDocument(None, 'XidML', None)
-    root = doc.documentElement
-    root.setAttribute('version', '3.0')
-
-    instr = doc.createElement('Instrumentation')
-    root.appendChild(instr)
+# extra entity needed when escaping a double-quoted XML attribute value
+_ATTR_ENTITIES = {'"': '&quot;'}
 
-    pkg = doc.createElement('Package')
-    pkg.setAttribute('name', 'MyStream')
-    pkg.setAttribute('ienaKey', f'0x{iena_key:04X}')
-    instr.appendChild(pkg)
-
-    param_set = doc.createElement('ParameterSet')
-    pkg.appendChild(param_set)
 
+def generate_xidml(var_names: list[str], iena_key: int, output_path: str):
+    """Generate a XidML metadata file describing the stream parameters."""
+    # the structure is flat, so write it directly instead of building a DOM
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<XidML version="3.0">',
+        '  <Instrumentation>',
+        f'    <Package name="MyStream" ienaKey="0x{iena_key:04X}">',
+        '      <ParameterSet>',
+    ]
     for idx, name in enumerate(var_names):
-        param = doc.createElement('Parameter')
-        param.setAttribute('name', name)
-        param.setAttribute('index', str(idx))
+        range_max = idx + 1
+        lines += [
+            f'        <Parameter name="{escape(name, _ATTR_ENTITIES)}" index="{idx}">',
+            '          <DataFormat>Float32</DataFormat>',
+            '          <RangeMinimum>0.0</RangeMinimum>',
+            f'          <RangeMaximum>{float(range_max)}</RangeMaximum>',
+            '        </Parameter>',
+        ]
+    lines += [
+        '      </ParameterSet>',
+        '    </Package>',
+        '  </Instrumentation>',
+        '</XidML>',
+        '',
+    ]
 
-        fmt_el = doc.createElement('DataFormat')
-        fmt_el.appendChild(doc.createTextNode('Float32'))
-        param.appendChild(fmt_el)
+    with open(output_path, 'wb') as f:
+        f.write('\n'.join(lines).encode('utf-8'))
+    print(f"Wrote XidML config to {output_path} ({len(var_names)} parameters)")
 
-        range_max = idx + 1
-        min_el = doc.createElement('RangeMinimum')
-        min_el.appendChild(doc.createTextNode('0.0'))
-        param.appendChild(min_el)
 
-        max_el = doc.createElement('RangeMaximum')
-        max_el.appendChild(doc.createTextNode(str(float(range_max))))
-        param.appendChild(max_el)
+def _local_day_bounds_ns() -> tuple[int, int]:
+    """Return (midnight, next midnight) of the current local day in epoch ns."""
+    lt = time.localtime()
+    start = time.mktime((lt.tm_year, lt.tm_mon, lt.tm_mday, 0, 0, 0, 0, 0, -1))
+    end = time.mktime((lt.tm_year, lt.tm_mon, lt.tm_mday + 1, 0, 0, 0, 0, 0, -1))
+    return int(start) * 1_000_000_000, int(end) * 1_000_000_000
 
-        param_set.appendChild(param)
 
-    xml_str = doc.toprettyxml(indent='  ', encoding='UTF-8')
-    with open(output_path, 'wb') as f:
-        f.write(xml_str)
-    print(f"Wrote XidML config to {output_path} ({len(var_names)} parameters)")
+# Cached once and refreshed only at day rollover, so timestamping a packet is
+# plain integer arithmetic.
+_day_start_ns, _day_end_ns = _local_day_bounds_ns()
 
 
-def build_iena_packet(key: int, sequence: int, values: list[float],
+def build_iena_packet(key: int, sequence: int, values: Sequence[float],
                       num_params: int) -> bytes:
     """Build a single IENA packet with the given parameter values."""
-    now = datetime.now()
-    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    us_since_midnight = int((now - midnight).total_seconds() * 1_000_000)
+    global _day_start_ns, _day_end_ns
+    now_ns = time.time_ns()
+    if not _day_start_ns <= now_ns < _day_end_ns:
+        _day_start_ns, _day_end_ns = _local_day_bounds_ns()
+    us_since_midnight = (now_ns - _day_start_ns) // 1000
     time_high = us_since_midnight & 0xFFFFFFFF
     time_low = 0
 
-    payload = struct.pack(f'>{num_params}f', *values)
-
-    total_bytes = 16 + len(payload) + 2
+    payload_size = num_params * 4
+    total_bytes = HEADER_SIZE + payload_size + TRAILER_SIZE
     size_words = total_bytes // 2
 
     status = 0x0000
 
-    header = struct.pack('>HH I HH HH',
-                         key,
-                         size_words,
-                         time_high,
-                         time_low,
-                         status,
-                         sequence & 0xFFFF,
-                         num_params)
-
-    trailer = struct.pack('>H', IENA_TRAILER)
-
-    return header + payload + trailer
-
-
-def generate_random_values(num_params: int) -> list[float]:
-    """Generate one random sample per variable. Range of var[i] is [0, i+1]."""
-    return [random.uniform(0, i + 1) for i in range(num_params)]
+    # pack straight into one buffer instead of concatenating three bytes objects
+    buf = bytearray(total_bytes)
+    _HEADER.pack_into(buf, 0,
+                      key,
+                      size_words,
+                      time_high,
+                      time_low,
+                      status,
+                      sequence & 0xFFFF,
+                      num_params)
+    off = HEADER_SIZE + payload_size
+
+    # float32 conversion and byteswap each run as one C loop over the array
+    payload = array('f', values)
+    if len(payload) != num_params:
+        raise ValueError(f'expected {num_params} values, got {len(payload)}')
+    if _SWAP_PAYLOAD:
+        payload.byteswap()
+    buf[HEADER_SIZE:off] = payload
+
+    buf[off] = _TRAILER_HI
+    buf[off + 1] = _TRAILER_LO
+
+    return bytes(buf)
+
+
+def generate_random_values(scales: array) -> array:
+    """
+    Generate one random sample per variable as a float32 array.
+    Range of var[i] is [0, scales[i]]; map/iter keep the loop in C.
+    """
+    return array('f', map(operator.mul, scales, iter(random.random, None)))
+
+
+def _is_multicast(addr: str) -> bool:
+    try:
+        return ipaddress.ip_address(addr).is_multicast
+    except ValueError:   # hostname
+        return False
 
 
 def main():
@@ -191,8 +232,22 @@ def main():
             sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF,
                             socket.inet_aton(args.iface))
 
+    # For multicast/broadcast the destination never changes, so connect once
+    # and use send(); this skips resolving the address on every packet.
+    # Unicast destinations keep sendto(): a connected socket would receive
+    # ICMP port-unreachable replies and raise while no receiver is running.
+    if broadcast_mode or _is_multicast(dest_addr):
+        sock.connect((dest_addr, args.port))
+        send = sock.send
+    else:
+        dest = (dest_addr, args.port)
+
+        def send(packet: bytes):
+            sock.sendto(packet, dest)
+
     interval = 1.0 / args.rate
     sequence = 0
+    scales = array('d', range(1, num_params + 1))   # var[i] spans [0, i+1]
 
     if broadcast_mode:
         print(f"IENA Broadcast Sender")
@@ -212,12 +267,13 @@ def main():
     print("Press Ctrl+C to stop.\n")
 
     try:
+        # deadline-based pacing: each packet is scheduled one interval after
+        # the previous deadline, so late wakeups don't accumulate as drift
+        next_t = time.perf_counter()
         while True:
-            t_start = time.monotonic()
-
-            values = generate_random_values(num_params)
+            values = generate_random_values(scales)
             packet = build_iena_packet(args.key, sequence, values, num_params)
-            sock.sendto(packet, (dest_addr, args.port))
+            send(packet)
 
             if sequence % max(1, int(args.rate)) == 0:
                 preview = ', '.join(
@@ -226,9 +282,13 @@ def main():
 
             sequence += 1
 
-            elapsed = time.monotonic() - t_start
-            if elapsed < interval:
-                time.sleep(interval - elapsed)
+            next_t += interval
+            delay = next_t - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            elif delay < -interval:
+                # fell more than a period behind — resync instead of bursting
+                next_t = time.perf_counter()
 
     except KeyboardInterrupt:
         print(f"\nStopped after {sequence} packets.")